@@ -3,22 +3,54 @@ import sqlite3
 import random
 import time
 import pandas as pd
+import numpy as np
 import os
+import json
 
 # DB 파일 이름 설정
 DB_NAME = 'english_words_final.db'
+# 출제 단어/뜻 추출용 난수 생성기
+RNG = np.random.default_rng()
+# 명예의 전당에 표시할 최대 순위 수
+RANKING_LIMIT = 10
+
+# 화면 HTML 템플릿 (매 rerun마다 문자열을 새로 조립하지 않도록 모듈 수준에 고정)
+WORD_HTML = "<h1 style='text-align: center; font-size: 60px;'>{english}</h1>"
+WORD_META_HTML = "<p style='text-align: center; color: gray;'>({w_type} / Ch.{chapter})</p>"
+FINISHED_HTML = "<h2 style='text-align: center;'>🎉 수고하셨습니다!</h2>"
 
 # --- 데이터베이스 관리 ---
-@st.cache_resource
-def get_connection():
+def open_connection():
     # DB 파일이 없는 경우를 대비한 체크
     if not os.path.exists(DB_NAME):
         # 임시로 빈 파일을 만들거나 에러를 띄울 수 있음
         pass
-    return sqlite3.connect(DB_NAME, check_same_thread=False)
+    conn = sqlite3.connect(DB_NAME, check_same_thread=False)
+    # 연결을 계속 재사용하므로 WAL 및 캐시 관련 PRAGMA는 연결 생성 시 1회만 적용
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+    """)
+    return conn
 
+@st.cache_resource
+def get_connection():
+    """쓰기용 연결 (init_db, save_score)"""
+    return open_connection()
+
+@st.cache_resource
+def get_read_connection():
+    """조회 전용 연결: 쓰기 연결과 분리해 조회가 저장 작업과 같은 연결을 두고 경합하지 않도록 함"""
+    conn = open_connection()
+    conn.execute("PRAGMA query_only=1")
+    return conn
+
+@st.cache_resource
 def init_db():
-    """앱 시작 시 1회만 실행될 초기화 로직"""
+    """앱 시작 시 1회만 실행될 초기화 로직 (cache_resource로 프로세스당 1회로 제한)"""
     conn = get_connection()
     cursor = conn.cursor()
     # 단어 테이블은 이미 있다고 가정 (사용자 코드 기준)
@@ -35,8 +67,8 @@ def init_db():
             played_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    
-    # 컬럼 체크 및 추가 (하위 호환성)
+
+    # 컬럼 체크 및 추가 (하위 호환성, 아래 인덱스가 total_questions를 포함하므로 먼저 수행)
     cursor.execute("PRAGMA table_info(rankings)")
     columns = [info[1] for info in cursor.fetchall()]
     if 'total_questions' not in columns:
@@ -44,76 +76,180 @@ def init_db():
             cursor.execute("ALTER TABLE rankings ADD COLUMN total_questions INTEGER DEFAULT 0")
         except sqlite3.OperationalError:
             pass
+
+    # 조회 조건/정렬 순서와 동일한 복합 인덱스 (풀 스캔 + 정렬 제거)
+    # 단어 테이블이 없는 DB에서도 앱이 뜨도록 존재할 때만 인덱스 생성
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'words'")
+    if cursor.fetchone() is not None:
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_words_book_chap_type ON words(book_name, chapter, type)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_rank_bct_score ON rankings(book_name, chapter, total_questions, score DESC, time_taken ASC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_rank_champ ON rankings(book_name, chapter, score DESC, time_taken ASC)")
+
+    # 플래너 통계가 아직 없으면 인덱스 생성 직후 1회만 수집
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+    if cursor.fetchone() is None:
+        cursor.execute("ANALYZE")
     conn.commit()
 
-def pick_random_meaning(text):
-    if not text: return ""
-    parts = [p.strip() for p in text.split(';') if p.strip()]
-    return random.choice(parts) if parts else text
+def build_all_options(meanings):
+    """게임 시작 시 모든 문제의 보기(정답 1 + 오답 3)를 한 번에 생성"""
+    # 오답 후보들 (현재 범위 내 단어들의 모든 뜻, 중복 제거)
+    meanings_pool = tuple(dict.fromkeys(meanings))
+    all_options = []
+    for correct in meanings:
+        # 4개를 뽑아 정답을 제외하면 나머지 뜻 중 3개를 균등하게 고른 것과 같음
+        picks = random.sample(meanings_pool, min(4, len(meanings_pool)))
+        options = [m for m in picks if m != correct][:3]
+        options += ["(오답 부족)"] * (3 - len(options))
+        options.append(correct)
+        random.shuffle(options)
+        all_options.append(options)
+    return all_options
 
 # --- 데이터 헬퍼 함수 ---
+@st.cache_data(ttl=3600)
+def load_word_meta():
+    """단어장/챕터/유형 목록을 한 번의 쿼리로 조회 -> (books, {book: chapters}, {book: types})"""
+    conn = get_read_connection()
+    cursor = conn.cursor()
+    # 빈 책 이름은 DB에서 걸러내고, 결과는 중간 리스트 없이 커서에서 바로 순회
+    # 인덱스를 타면 책 이름순으로 나오므로 MIN(rowid)로 정렬해 테이블에 처음 등장한 순서를 유지
+    cursor.execute("""
+        SELECT book_name, chapter, type, MIN(rowid) AS first_row FROM words
+        WHERE book_name IS NOT NULL AND book_name <> ''
+        GROUP BY book_name, chapter, type
+        ORDER BY first_row
+    """)
+    books, chapters, types = [], {}, {}
+    for book, chap, w_type, _ in cursor:
+        if book not in chapters:
+            books.append(book)
+            chapters[book], types[book] = set(), set()
+        if chap != 0:
+            try: chapters[book].add(int(chap))
+            except: pass
+        if w_type: types[book].add(w_type)
+    return books, {b: sorted(c) for b, c in chapters.items()}, {b: sorted(t) for b, t in types.items()}
+
 def get_books():
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT book_name FROM words")
-        return [row[0] for row in cursor.fetchall() if row[0]]
+        return load_word_meta()[0]
     except Exception as e:
         st.error(f"DB 오류 (책 목록): {e}")
         return []
 
 def get_chapters(book_name):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT chapter FROM words WHERE book_name = ? AND chapter != 0", (book_name,))
-    raw = cursor.fetchall()
-    chapters = []
-    for row in raw:
-        try: chapters.append(int(row[0]))
-        except: continue
-    return sorted(list(set(chapters)))
+    return load_word_meta()[1].get(book_name, [])
 
 def get_types(book_name):
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT type FROM words WHERE book_name = ?", (book_name,))
-    return sorted([row[0] for row in cursor.fetchall() if row[0]])
+    return load_word_meta()[2].get(book_name, [])
 
-def get_words_by_range(book_name, start_chap, end_chap, selected_types=None):
-    conn = get_connection()
-    cursor = conn.cursor()
-    query = "SELECT english, korean, type, chapter FROM words WHERE book_name = ? AND chapter >= ? AND chapter <= ?"
-    params = [book_name, start_chap, end_chap]
-    if selected_types:
-        placeholders = ','.join(['?'] * len(selected_types))
-        query += f" AND type IN ({placeholders})"
-        params.extend(selected_types)
-    cursor.execute(query, params)
-    raw = cursor.fetchall()
-    return [(eng, pick_random_meaning(kor), w_type, chap) for eng, kor, w_type, chap in raw]
+def split_meanings(korean):
+    """';'로 구분된 뜻을 미리 분리 -> (모든 뜻을 이어붙인 평탄한 배열, 행별 시작 위치, 행별 뜻 개수)"""
+    korean = korean.fillna('')
+    # 뜻이 하나뿐인 행(';' 없음)은 split/explode 없이 strip만 수행
+    multi = korean.str.contains(';', regex=False).to_numpy()
+    parts = pd.concat([korean[~multi].str.strip(), korean[multi].str.split(';').explode().str.strip()])
+    parts = parts.sort_index(kind='stable')
+    parts = parts[parts != '']
+    # 정렬 후 뜻들이 원래 행 순서대로 이어져 있으므로 개수의 누적합이 곧 시작 위치
+    lens = parts.groupby(level=0, sort=False).size().reindex(korean.index, fill_value=0).to_numpy()
+    starts = np.cumsum(lens) - lens
+    return parts.to_numpy(), starts, lens
+
+@st.cache_data(ttl=3600)
+def fetch_words(book_name, start_chap, end_chap, selected_types=()):
+    """범위 내 단어 조회 + 뜻 분리 (캐시되므로 분리 작업은 캐시 갱신 시에만 수행)"""
+    conn = get_read_connection()
+    # 유형 목록은 JSON 파라미터 하나로 전달 -> 선택 개수와 무관하게 항상 같은 SQL (문장 캐시 재사용)
+    types_json = json.dumps(list(selected_types)) if selected_types else None
+    df = pd.read_sql_query("""
+        SELECT english, korean, type, chapter FROM words
+        WHERE book_name = ? AND chapter >= ? AND chapter <= ?
+          AND (? IS NULL OR type IN (SELECT value FROM json_each(?)))
+    """, conn, params=(book_name, start_chap, end_chap, types_json, types_json))
+    return (df, *split_meanings(df['korean']))
+
+def get_words_by_range(book_name, start_chap, end_chap, selected_types=None, limit=None):
+    """범위 내 단어를 무작위 순서로 최대 limit개(None이면 전체) 반환"""
+    # 선택 순서와 무관하게 같은 캐시 키가 되도록 유형을 정렬된 튜플로 전달
+    df, parts, starts, lens = fetch_words(book_name, start_chap, end_chap, tuple(sorted(selected_types or ())))
+    n = len(df)
+    k = n if limit is None else min(n, limit)
+    # 출제할 행을 먼저 뽑음 (Generator.choice는 k가 작으면 O(k) 방식으로 비복원 추출)
+    rows = RNG.choice(n, size=k, replace=False)
+    # 뽑힌 행에 대해서만 뜻 하나를 무작위로 선택, 뜻이 하나도 없는 행은 원문 그대로 유지
+    lens, starts = lens[rows], starts[rows]
+    has_parts = lens > 0
+    picks = starts + (RNG.random(k) * lens).astype(int)
+    sub = df.iloc[rows]
+    korean = sub['korean'].fillna('').to_numpy(dtype=object)
+    korean[has_parts] = parts[picks[has_parts]]
+    return list(zip(sub['english'].tolist(), korean.tolist(), sub['type'].tolist(), sub['chapter'].tolist()))
 
+@st.cache_data(ttl=60)
 def get_rankings(book, chapter, total_q):
-    conn = get_connection()
-    return pd.read_sql_query("""
-        SELECT 
-            RANK() OVER (ORDER BY score DESC, time_taken ASC) as '순위',
-            player_name as '이름', 
-            (score || ' / ' || total_questions) as '점수',
-            round(time_taken, 2) as '시간(초)', 
-            datetime(played_at, 'localtime') as '날짜'
+    """상위 RANKING_LIMIT개 기록을 표시용 행(dict) 리스트로 반환 (행 수가 적어 DataFrame 없이 처리)"""
+    conn = get_read_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT player_name, score, total_questions, time_taken, datetime(played_at, 'localtime')
         FROM rankings 
         WHERE book_name = ? AND chapter = ? AND total_questions = ?
         ORDER BY score DESC, time_taken ASC 
-    """, conn, params=(book, chapter, total_q))
+        LIMIT ?
+    """, (book, chapter, total_q, RANKING_LIMIT))
+    rows, rank, prev_key = [], 0, None
+    for i, (name, score, total, time_taken, played_local) in enumerate(cursor, start=1):
+        # 이미 정렬되어 있으므로 (점수, 시간)이 바뀔 때의 순번이 곧 RANK() 값
+        if (score, time_taken) != prev_key:
+            rank, prev_key = i, (score, time_taken)
+        rows.append({
+            '순위': rank,
+            '이름': name,
+            '점수': f"{score} / {total}",
+            '시간(초)': None if time_taken is None else round(time_taken, 2),
+            # 날짜는 SQLite가 UTC -> 로컬 시간으로 변환 (ISO 'T' 구분자, 소수 초, NULL도 처리)
+            '날짜': played_local,
+        })
+    return rows
 
-def save_score(name, book, chapter, score, total_q, time_taken):
-    conn = get_connection()
+@st.cache_data(ttl=60)
+def get_all_champions():
+    """책별 전체 범위(chapter = 0) 1위를 한 번의 쿼리로 조회 -> {book: (name, score, total)}"""
+    conn = get_read_connection()
     cursor = conn.cursor()
     cursor.execute("""
-        INSERT INTO rankings (player_name, book_name, chapter, score, total_questions, time_taken)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (name, book, int(chapter), int(score), int(total_q), float(time_taken)))
-    conn.commit()
+        SELECT book_name, player_name, score, total_questions FROM (
+            SELECT book_name, player_name, score, total_questions,
+                   ROW_NUMBER() OVER (PARTITION BY book_name ORDER BY score DESC, time_taken ASC) AS rn
+            FROM rankings WHERE chapter = 0
+        ) WHERE rn = 1
+    """)
+    return {row[0]: row[1:] for row in cursor}
+
+def save_score(name, book, chapter, score, total_q, time_taken):
+    conn = get_connection()
+    # 공유 연결이므로 with 블록으로 커밋/롤백을 보장
+    with conn:
+        conn.execute("""
+            INSERT INTO rankings (player_name, book_name, chapter, score, total_questions, time_taken)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (name, book, int(chapter), int(score), int(total_q), float(time_taken)))
+    # 랭킹이 바뀌었으므로 랭킹 관련 캐시만 비움
+    get_rankings.clear()
+    get_all_champions.clear()
+
+def reload_db():
+    """DB 파일이 교체된 경우: 연결/초기화/조회 캐시를 모두 비워 새 파일을 다시 열도록 함"""
+    # 다른 세션이 아직 쓰고 있을 수 있으므로 기존 연결은 닫지 않고 캐시에서만 제거 (참조가 사라지면 자동 해제)
+    get_read_connection.clear()
+    get_connection.clear()
+    init_db.clear()
+    load_word_meta.clear()
+    fetch_words.clear()
+    get_rankings.clear()
+    get_all_champions.clear()
 
 # --- 앱 UI 및 로직 ---
 st.set_page_config(page_title="쑥쑥단어게임", page_icon="⚡", layout="wide")
@@ -123,21 +259,24 @@ init_db()
 if 'stage' not in st.session_state: st.session_state['stage'] = 'setup'
 if 'score' not in st.session_state: st.session_state['score'] = 0
 
+# 게임 1회분 문제 데이터 (게임 시작 시 생성, 종료 시 해제)
+GAME_DATA_KEYS = ('englishes', 'meanings', 'types', 'chapters', 'all_options')
+
 # 콜백 함수 정의 (게임 진행용)
 def handle_answer_click(selected_meaning, current_idx):
-    # 중복 클릭 방지
-    if current_idx in st.session_state.get('solved_indexes', set()):
+    # 중복 클릭 방지 (current_q는 단조 증가하므로 마지막으로 제출한 번호만 기억하면 충분)
+    if current_idx <= st.session_state.get('last_submitted_q', -1):
         return
+    st.session_state['last_submitted_q'] = current_idx
 
-    correct_meaning = st.session_state['words'][current_idx][1]
+    correct_meaning = st.session_state['meanings'][current_idx]
     
+    # 콜백 안에서는 요소를 그리지 않고 결과만 저장 -> 다음 화면 렌더링 때 토스트로 표시
     if selected_meaning == correct_meaning:
         st.session_state['score'] += 1
-        st.toast("⭕ 정답입니다!", icon="✅")
+        st.session_state['last_feedback'] = ("⭕ 정답입니다!", "✅")
     else:
-        st.toast(f"❌ 틀렸습니다! 정답: {correct_meaning}", icon="⚠️")
-    
-    st.session_state['solved_indexes'].add(current_idx)
+        st.session_state['last_feedback'] = (f"❌ 틀렸습니다! 정답: {correct_meaning}", "⚠️")
     
     # 다음 문제 또는 종료
     if st.session_state['current_q'] + 1 < st.session_state['total_q']:
@@ -145,25 +284,66 @@ def handle_answer_click(selected_meaning, current_idx):
     else:
         st.session_state['end_time'] = time.time()
         st.session_state['stage'] = 'finished'
+        # 문제 데이터는 더 이상 필요 없으므로 키 단위로 바로 해제
+        for k in GAME_DATA_KEYS: st.session_state.pop(k, None)
+
+def show_feedback():
+    """직전 답안의 정답/오답 결과를 토스트로 1회 표시"""
+    feedback = st.session_state.pop('last_feedback', None)
+    if feedback:
+        st.toast(feedback[0], icon=feedback[1])
+
+@st.fragment
+def play_question():
+    """문제 화면 (fragment: 답 클릭 시 이 영역만 다시 그리고 사이드바 등은 건너뜀)"""
+    # 마지막 문제를 풀어 단계가 바뀌면 앱 전체를 다시 실행
+    if st.session_state['stage'] != 'playing':
+        st.rerun()
+
+    show_feedback()
+    idx = st.session_state['current_q']
+    
+    # 진행도 표시
+    st.progress((idx) / st.session_state['total_q'], text=f"문제 {idx+1} / {st.session_state['total_q']}")
+    
+    st.markdown(WORD_HTML.format(english=st.session_state['englishes'][idx]), unsafe_allow_html=True)
+    st.markdown(WORD_META_HTML.format(w_type=st.session_state['types'][idx], chapter=st.session_state['chapters'][idx]), unsafe_allow_html=True)
+    
+    # 보기 (게임 시작 시 미리 생성됨)
+    options = st.session_state['all_options'][idx]
+    
+    # 버튼 레이아웃
+    cols = st.columns(2)
+    for i, opt in enumerate(options):
+        cols[i // 2].button(f"{i+1}. {opt}", use_container_width=True, key=f"btn_{idx}_{i}",
+                            on_click=handle_answer_click, args=(opt, idx))
 
 # --- 화면 렌더링 ---
 
+# 단어장 목록은 사이드바와 설정 단계에서 함께 사용하므로 1회만 조회
+books = get_books()
+
 # 사이드바 (챔피언 정보)
 with st.sidebar:
     st.title("🏆 명예의 전당")
-    books = get_books()
+    champions = get_all_champions()
+    # 책마다 위젯을 만들지 않고 하나의 요소로 렌더링
+    lines = []
     for b in books:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT player_name, score, total_questions FROM rankings WHERE book_name = ? AND chapter = 0 ORDER BY score DESC, time_taken ASC LIMIT 1", (b,))
-        res = cursor.fetchone()
+        res = champions.get(b)
         if res:
-            st.info(f"**{b}**\n👑 {res[0]} ({res[1]}/{res[2]})")
+            lines.append(f"**{b}**\n👑 {res[0]} ({res[1]}/{res[2]})")
+    if lines:
+        st.info("\n\n---\n\n".join(lines))
+
+    # 단어 DB 파일을 교체한 경우 새 파일을 다시 열고 단어장/랭킹을 즉시 갱신
+    if st.button("🔄 단어장 새로고침", use_container_width=True):
+        reload_db()
+        st.rerun()
 
 # 1. 설정 단계
 if st.session_state['stage'] == 'setup':
     st.title("⚡ 쑥쑥단어게임 설정")
-    books = get_books()
     if not books:
         st.warning("DB에 등록된 단어장이 없습니다. DB 파일을 확인해주세요.")
     else:
@@ -180,74 +360,45 @@ if st.session_state['stage'] == 'setup':
         q_count_opt = st.radio("문제 수", ["10", "20", "40", "전체"], horizontal=True, index=1)
         
         if st.button("🚀 게임 시작!", type="primary", use_container_width=True):
-            words = get_words_by_range(selected_book, start_ch, end_ch, sel_types)
-            if not words:
+            limit = None if q_count_opt == "전체" else int(q_count_opt)
+            final_words = get_words_by_range(selected_book, start_ch, end_ch, sel_types, limit)
+            if not final_words:
                 st.error("해당 범위에 단어가 없습니다!")
             else:
-                if q_count_opt == "전체": target_n = len(words)
-                else: target_n = min(len(words), int(q_count_opt))
-                
-                final_words = random.sample(words, target_n)
+                target_n = len(final_words)
+                # 문제 데이터는 열 단위 리스트로 저장 (english, meaning, type, chapter)
+                englishes, meanings, w_types, w_chapters = (list(col) for col in zip(*final_words))
                 st.session_state.update({
-                    'words': final_words,
+                    'englishes': englishes,
+                    'meanings': meanings,
+                    'types': w_types,
+                    'chapters': w_chapters,
                     'total_q': target_n,
                     'current_q': 0,
                     'score': 0,
                     'start_time': time.time(),
                     'stage': 'playing',
-                    'solved_indexes': set(),
+                    'last_submitted_q': -1,
+                    'all_options': build_all_options(meanings),
                     'book': selected_book,
                     'chapter': 0 if (start_ch == min(chapters) and end_ch == max(chapters)) else (start_ch if start_ch == end_ch else -1)
                 })
-                # 이전 게임 옵션 초기화
-                for k in list(st.session_state.keys()):
-                    if k.startswith('opts_'): del st.session_state[k]
                 st.rerun()
 
 # 2. 게임 진행 단계
 elif st.session_state['stage'] == 'playing':
-    idx = st.session_state['current_q']
-    words = st.session_state['words']
-    curr_word = words[idx]
-    
-    # 진행도 표시
-    st.progress((idx) / st.session_state['total_q'], text=f"문제 {idx+1} / {st.session_state['total_q']}")
-    
-    st.markdown(f"<h1 style='text-align: center; font-size: 60px;'>{curr_word[0]}</h1>", unsafe_allow_html=True)
-    st.markdown(f"<p style='text-align: center; color: gray;'>({curr_word[2]} / Ch.{curr_word[3]})</p>", unsafe_allow_html=True)
-    
-    # 보기 생성 (세션에 저장하여 고정)
-    opt_key = f'opts_{idx}'
-    if opt_key not in st.session_state:
-        correct = curr_word[1]
-        # 오답 후보들 (현재 범위 내 단어들의 모든 뜻 중 정답 제외)
-        all_meanings = list(set([w[1] for w in words if w[1] != correct]))
-        if len(all_meanings) < 3:
-            wrong_opts = all_meanings + ["(오답 부족)"] * (3 - len(all_meanings))
-        else:
-            wrong_opts = random.sample(all_meanings, 3)
-        
-        options = wrong_opts + [correct]
-        random.shuffle(options)
-        st.session_state[opt_key] = options
-    
-    options = st.session_state[opt_key]
-    
-    # 버튼 레이아웃
-    col1, col2 = st.columns(2)
-    for i, opt in enumerate(options):
-        with (col1 if i < 2 else col2):
-            st.button(f"{i+1}. {opt}", use_container_width=True, key=f"btn_{idx}_{i}", 
-                      on_click=handle_answer_click, args=(opt, idx))
+    play_question()
 
 # 3. 게임 종료 단계
 elif st.session_state['stage'] == 'finished':
+    # 마지막 문제의 정답/오답 결과
+    show_feedback()
     st.balloons()
     total_time = st.session_state['end_time'] - st.session_state['start_time']
     score = st.session_state['score']
     total = st.session_state['total_q']
     
-    st.markdown(f"<h2 style='text-align: center;'>🎉 수고하셨습니다!</h2>", unsafe_allow_html=True)
+    st.markdown(FINISHED_HTML, unsafe_allow_html=True)
     st.metric("최종 점수", f"{score} / {total}", f"{int(score/total*100)}%")
     st.write(f"소요 시간: {total_time:.2f}초")
     
@@ -271,11 +422,11 @@ elif st.session_state['stage'] == 'ranking':
     book = st.session_state['book']
     chap = st.session_state['chapter']
     
-    df = get_rankings(book, chap, st.session_state['total_q'])
-    if df.empty:
+    rankings = get_rankings(book, chap, st.session_state['total_q'])
+    if not rankings:
         st.info("아직 이 조건의 랭킹 데이터가 없습니다.")
     else:
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.dataframe(rankings, use_container_width=True, hide_index=True)
         
     if st.button("새 게임 시작"):
         st.session_state['stage'] = 'setup'